@@ -12,11 +12,13 @@ Simulates a complete 3-floor office building with:
 import asyncio
 import logging
 import math
-import random
 import sys
+from collections.abc import Callable
 from datetime import datetime
-from typing import Any
+from functools import partial
+from typing import Any, Final
 
+import numpy as np
 from bacpypes3.app import Application
 from bacpypes3.argparse import SimpleArgumentParser
 from bacpypes3.basetypes import EngineeringUnits
@@ -28,6 +30,7 @@ from bacpypes3.local.analog import (
 )
 from bacpypes3.local.binary import BinaryInputObject, BinaryOutputObject
 from bacpypes3.local.cmd import Commandable
+from numba import njit
 
 # Configure logging
 logging.basicConfig(
@@ -40,6 +43,19 @@ _log = ModuleLogger(globals())
 
 INTERVAL = 5.0  # Update interval in seconds
 
+# Per-tick constants, folded into the compiled kernels
+_DT_MIN: Final = INTERVAL / 60.0  # Interval in minutes
+_DT_HR: Final = INTERVAL / 3600.0  # Interval in hours
+_INV_AIRFLOW_REF: Final = 1.0 / 2000.0  # Reference VAV airflow, 1/CFM
+_FAN_POWER_COEFF: Final = 15e-6  # kW per %^3, i.e. 15 kW at 100%
+
+# Daily outdoor temperature shape, one entry per hour of the day
+_SIN_HOUR: Final = tuple(math.sin((h - 6) * math.pi / 12) for h in range(24))
+
+# Binary presentValue states
+_ACTIVE = "active"
+_INACTIVE = "inactive"
+
 # --- Custom Object Classes ---
 
 
@@ -48,17 +64,279 @@ class CommandableAnalogValueObject(Commandable, AnalogValueObject):
     """Commandable Analog Value Object."""
 
 
+class DeferredCOV:
+    """Batch presentValue change notifications for simulation-driven objects.
+
+    Assigning presentValue goes through the bacpypes3 Object.__setattr__,
+    which resolves the property and runs the COV/event property monitors on
+    every write. set_present_value() stores the value directly and remembers
+    the value from before the first change; flush_cov() then runs the
+    monitors once. Only for non-commandable objects, since this bypasses
+    the priority array.
+    """
+
+    _elements: dict[str, Any]
+    _property_monitors: dict[str, list[Callable[..., None]]]
+
+    _cov_pending = False
+    _cov_old_value: Any = None
+
+    def set_present_value(self, value: Any):
+        """Store a new presentValue without notifying monitors yet."""
+        element = self._elements["presentValue"]
+        if value.__class__ is not element:
+            value = element(element.cast(value))
+
+        current_value = object.__getattribute__(self, "presentValue")
+        if value == current_value:
+            return
+        if not self._cov_pending:
+            self._cov_pending = True
+            self._cov_old_value = current_value
+        object.__setattr__(self, "presentValue", value)
+
+    def flush_cov(self):
+        """Tell the presentValue monitors about changes since the last flush."""
+        if not self._cov_pending:
+            return
+        self._cov_pending = False
+
+        old_value = self._cov_old_value
+        new_value = object.__getattribute__(self, "presentValue")
+        for fn in self._property_monitors["presentValue"]:
+            fn(old_value, new_value)
+
+
+@bacpypes_debugging
+class SimulatedAnalogInputObject(DeferredCOV, AnalogInputObject):
+    """Analog Input Object updated by the simulation every tick."""
+
+
+@bacpypes_debugging
+class SimulatedBinaryInputObject(DeferredCOV, BinaryInputObject):
+    """Binary Input Object updated by the simulation every tick."""
+
+
 # --- Building Physics Simulation ---
 
+# Layout of the float64 state buffer shared by BuildingState and the kernels
+_NUM_ZONES = 6
+
+_IDX_CHW_SUPPLY_TEMP = 0
+_IDX_CHW_RETURN_TEMP = 1
+_IDX_HW_SUPPLY_TEMP = 2
+_IDX_HW_RETURN_TEMP = 3
+_IDX_AHU_SUPPLY_AIR_TEMP = 4
+_IDX_AHU_RETURN_AIR_TEMP = 5
+_IDX_AHU_MIXED_AIR_TEMP = 6
+_IDX_AHU_SUPPLY_AIR_FLOW = 7
+_IDX_AHU_FAN_SPEED = 8
+_IDX_AHU_COOLING_VALVE = 9
+_IDX_AHU_HEATING_VALVE = 10
+_IDX_AHU_SUPPLY_AIR_SETPOINT = 11
+_IDX_TOTAL_POWER = 12
+_IDX_TOTAL_ENERGY = 13
+_IDX_VAV_ZONE_TEMPS = 14
+_IDX_VAV_ZONE_SETPOINTS = _IDX_VAV_ZONE_TEMPS + _NUM_ZONES
+_IDX_VAV_DAMPER_POSITIONS = _IDX_VAV_ZONE_SETPOINTS + _NUM_ZONES
+_IDX_VAV_AIRFLOWS = _IDX_VAV_DAMPER_POSITIONS + _NUM_ZONES
+_IDX_VAV_REHEAT_VALVES = _IDX_VAV_AIRFLOWS + _NUM_ZONES
+_BUF_SIZE = _IDX_VAV_REHEAT_VALVES + _NUM_ZONES
+
+# Layout of the per-tick noise vector (uniform samples in [-1, 1])
+_NOISE_AHU_FAN = 0
+_NOISE_CHW_SUPPLY = 1
+_NOISE_CHW_RETURN = 2
+_NOISE_MISC_POWER = 3
+_NOISE_OCCUPANCY = 4
+_NOISE_OUTDOOR_TEMP = 5
+_NOISE_METER_VOLTAGE = 6
+_NOISE_ZONE_LOAD = 7
+_NOISE_SIZE = _NOISE_ZONE_LOAD + _NUM_ZONES
+
+# Perimeter zones (even indices) have more solar gain
+_PERIM = np.array([0.3, 0.0, 0.3, 0.0, 0.3, 0.0], dtype=np.float64)
+
+# Noise-free zone load per occupancy state, indexed by int(is_occupied)
+_ZONE_BASE_LOAD = np.array([0.1 + _PERIM, 0.5 + _PERIM])
+
+# Kernel signatures over the contiguous float64 state buffer and noise
+# batch. Giving them explicitly compiles, or loads from the on-disk cache,
+# at import time rather than on the first tick.
+_SIG_HVAC = "void(f8[::1], f8, b1, f8[::1])"
+_SIG_CHILLER = "void(f8[::1], f8[::1])"
+_SIG_POWER = "void(f8[::1], b1, f8[::1])"
+
+
+@njit(_SIG_HVAC, cache=True, fastmath=True)
+def _update_hvac(buf, outdoor_temp, is_occupied, noise):
+    """Update the AHU and the VAV zones it serves in one pass."""
+    zone_temps = buf[_IDX_VAV_ZONE_TEMPS : _IDX_VAV_ZONE_TEMPS + _NUM_ZONES]
+    setpoints = buf[_IDX_VAV_ZONE_SETPOINTS : _IDX_VAV_ZONE_SETPOINTS + _NUM_ZONES]
+    dampers = buf[_IDX_VAV_DAMPER_POSITIONS : _IDX_VAV_DAMPER_POSITIONS + _NUM_ZONES]
+    airflows = buf[_IDX_VAV_AIRFLOWS : _IDX_VAV_AIRFLOWS + _NUM_ZONES]
+    reheat = buf[_IDX_VAV_REHEAT_VALVES : _IDX_VAV_REHEAT_VALVES + _NUM_ZONES]
+
+    # --- AHU ---
+
+    # Return air is average of all zone temps
+    return_air_temp = zone_temps.mean()
+    buf[_IDX_AHU_RETURN_AIR_TEMP] = return_air_temp
+
+    # Mixed air temperature (blend of return and outdoor)
+    outdoor_damper = 20.0 if is_occupied else 10.0  # % outdoor air
+    buf[_IDX_AHU_MIXED_AIR_TEMP] = (
+        return_air_temp * (100 - outdoor_damper) / 100
+        + outdoor_temp * outdoor_damper / 100
+    )
+
+    # Cooling valve control (PI controller)
+    temp_error = buf[_IDX_AHU_SUPPLY_AIR_TEMP] - buf[_IDX_AHU_SUPPLY_AIR_SETPOINT]
+    buf[_IDX_AHU_COOLING_VALVE] = max(
+        0.0, min(100.0, buf[_IDX_AHU_COOLING_VALVE] + temp_error * 2)
+    )
+
+    # Supply air temperature (affected by cooling valve)
+    cooling_effect = buf[_IDX_AHU_COOLING_VALVE] * 0.3  # Max 30°F cooling
+    supply_air_temp = buf[_IDX_AHU_MIXED_AIR_TEMP] - cooling_effect
+    buf[_IDX_AHU_SUPPLY_AIR_TEMP] = supply_air_temp
+
+    # Fan speed based on demand
+    base_fan_speed = 75.0 if is_occupied else 40.0
+    buf[_IDX_AHU_FAN_SPEED] = base_fan_speed + 5 * noise[_NOISE_AHU_FAN]
+
+    buf[_IDX_AHU_SUPPLY_AIR_FLOW] = buf[_IDX_AHU_FAN_SPEED] * 160  # CFM
+
+    # --- VAVs ---
+
+    # Zone load varies by occupancy, plus solar gain on perimeter zones
+    zone_load = (
+        _ZONE_BASE_LOAD[int(is_occupied)]
+        + 0.2 * noise[_NOISE_ZONE_LOAD : _NOISE_ZONE_LOAD + _NUM_ZONES]
+    )
+
+    # Temperature control (PI controller)
+    zone_error = zone_temps - setpoints
+
+    # Damper position control
+    dampers[:] = np.clip(dampers + zone_error * 3, 20.0, 100.0)
+
+    # Airflow based on damper position (max 3000 CFM)
+    airflows[:] = dampers * 30
+
+    # Zone temperature physics
+    # Cooling from supply air
+    zone_cooling = (airflows * _INV_AIRFLOW_REF) * (zone_temps - supply_air_temp) * 0.1
+    # Heat gain from zone load
+    heat_gain = zone_load * 2
+
+    zone_temps += (heat_gain - zone_cooling) * _DT_MIN
+
+    # Reheat valve (only if zone is too cold)
+    reheat[:] = np.clip(
+        np.where(zone_temps < setpoints - 1, reheat + 5, reheat - 5), 0.0, 100.0
+    )
+
+
+@njit(_SIG_CHILLER, cache=True, fastmath=True)
+def _update_chiller(buf, noise):
+    """Update chiller state based on cooling load."""
+    # Cooling load from AHU
+    cooling_load = buf[_IDX_AHU_COOLING_VALVE] * 100  # kW (simplified)
+
+    # Chilled water temps respond to load
+    if cooling_load > 50:
+        supply_temp, return_temp = 42.0, 52.0
+    else:
+        supply_temp, return_temp = 44.0, 54.0
+    buf[_IDX_CHW_SUPPLY_TEMP] = supply_temp + noise[_NOISE_CHW_SUPPLY]
+    buf[_IDX_CHW_RETURN_TEMP] = return_temp + noise[_NOISE_CHW_RETURN]
+
+
+@njit(_SIG_POWER, cache=True, fastmath=True)
+def _update_power(buf, is_occupied, noise):
+    """Calculate total building power consumption."""
+    # AHU fan power
+    fan_speed = buf[_IDX_AHU_FAN_SPEED]
+    ahu_power = fan_speed * fan_speed * fan_speed * _FAN_POWER_COEFF  # kW
+
+    # Chiller power (based on cooling valve position)
+    chiller_power = (buf[_IDX_AHU_COOLING_VALVE] / 100) * 80  # kW
+
+    # VAV reheat power
+    reheat_power = (
+        buf[_IDX_VAV_REHEAT_VALVES : _IDX_VAV_REHEAT_VALVES + _NUM_ZONES].sum()
+        / 100
+        * 2
+    )  # kW
+
+    # Lighting and plug loads
+    if is_occupied:
+        misc_power = 50 + 5 * noise[_NOISE_MISC_POWER]
+    else:
+        misc_power = 10 + 2 * noise[_NOISE_MISC_POWER]
+
+    buf[_IDX_TOTAL_POWER] = ahu_power + chiller_power + reheat_power + misc_power
+    buf[_IDX_TOTAL_ENERGY] += buf[_IDX_TOTAL_POWER] * _DT_HR  # kWh
+
+
+@njit(_SIG_HVAC, cache=True, fastmath=True)
+def _tick(buf, outdoor_temp, is_occupied, noise):
+    """Advance the HVAC and power physics in ``buf`` by one interval."""
+    _update_hvac(buf, outdoor_temp, is_occupied, noise)
+    _update_chiller(buf, noise)
+    _update_power(buf, is_occupied, noise)
+
+
+def _buf_field(index: int) -> property:
+    """Expose one slot of ``BuildingState.buf`` as a float attribute."""
+
+    def fget(self) -> float:
+        return float(self.buf[index])
+
+    def fset(self, value: float):
+        self.buf[index] = value
+
+    return property(fget, fset)
+
 
 class BuildingState:
     """Shared state for the entire building simulation."""
 
-    def __init__(self):
+    # Central plant
+    chilled_water_supply_temp = _buf_field(_IDX_CHW_SUPPLY_TEMP)
+    chilled_water_return_temp = _buf_field(_IDX_CHW_RETURN_TEMP)
+    hot_water_supply_temp = _buf_field(_IDX_HW_SUPPLY_TEMP)
+    hot_water_return_temp = _buf_field(_IDX_HW_RETURN_TEMP)
+
+    # AHU state
+    ahu_supply_air_temp = _buf_field(_IDX_AHU_SUPPLY_AIR_TEMP)
+    ahu_return_air_temp = _buf_field(_IDX_AHU_RETURN_AIR_TEMP)
+    ahu_mixed_air_temp = _buf_field(_IDX_AHU_MIXED_AIR_TEMP)
+    ahu_supply_air_flow = _buf_field(_IDX_AHU_SUPPLY_AIR_FLOW)
+    ahu_fan_speed = _buf_field(_IDX_AHU_FAN_SPEED)
+    ahu_cooling_valve = _buf_field(_IDX_AHU_COOLING_VALVE)
+    ahu_heating_valve = _buf_field(_IDX_AHU_HEATING_VALVE)
+    ahu_supply_air_setpoint = _buf_field(_IDX_AHU_SUPPLY_AIR_SETPOINT)
+
+    # Power consumption
+    total_power = _buf_field(_IDX_TOTAL_POWER)
+    total_energy = _buf_field(_IDX_TOTAL_ENERGY)
+
+    def __init__(self, seed: int | None = None):
         """Initialize building state with default values."""
+        # All numeric physics state lives in one buffer, see _IDX_* above
+        self.buf = np.zeros(_BUF_SIZE, dtype=np.float64)
+
+        # One batch of noise is drawn per tick into this buffer, see _NOISE_*
+        self.rng = np.random.default_rng(seed)
+        self.noise = np.zeros(_NOISE_SIZE, dtype=np.float64)
+
         # Time and occupancy
         self.outdoor_temp = 85.0  # °F
         self.is_occupied = True
+        self.occupancy_str = _ACTIVE
+        self.update_clock()
 
         # Central plant
         self.chilled_water_supply_temp = 44.0  # °F
@@ -76,156 +354,85 @@ class BuildingState:
         self.ahu_heating_valve = 0.0  # %
         self.ahu_supply_air_setpoint = 55.0  # °F
 
-        # VAV states (6 zones)
-        self.vav_zone_temps = [72.0] * 6
-        self.vav_zone_setpoints = [72.0] * 6
-        self.vav_damper_positions = [50.0] * 6
-        self.vav_airflows = [2000.0] * 6
-        self.vav_reheat_valves = [0.0] * 6
+        # VAV states (6 zones), views into buf so update them in place
+        self.vav_zone_temps = self._zone_view(_IDX_VAV_ZONE_TEMPS)
+        self.vav_zone_setpoints = self._zone_view(_IDX_VAV_ZONE_SETPOINTS)
+        self.vav_damper_positions = self._zone_view(_IDX_VAV_DAMPER_POSITIONS)
+        self.vav_airflows = self._zone_view(_IDX_VAV_AIRFLOWS)
+        self.vav_reheat_valves = self._zone_view(_IDX_VAV_REHEAT_VALVES)
+        self.vav_zone_temps[:] = 72.0
+        self.vav_zone_setpoints[:] = 72.0
+        self.vav_damper_positions[:] = 50.0
+        self.vav_airflows[:] = 2000.0
+        self.vav_reheat_valves[:] = 0.0
 
         # Power consumption
         self.total_power = 0.0
         self.total_energy = 0.0
 
+    def _zone_view(self, start: int) -> np.ndarray:
+        """Return the contiguous float64 per-zone slice of buf at ``start``."""
+        return self.buf[start : start + _NUM_ZONES]
+
+    def update_clock(self):
+        """Read the wall clock once for this tick."""
+        now = datetime.now()
+        self._hour = now.hour
+        self._weekday = now.weekday()
+
     def is_business_hours(self) -> bool:
         """Check if current time is business hours (8 AM - 6 PM weekdays)."""
-        now = datetime.now()
-        if now.weekday() >= 5:  # Weekend
+        if self._weekday >= 5:  # Weekend
             return False
-        return 8 <= now.hour < 18
+        return 8 <= self._hour < 18
 
     def update_occupancy(self):
         """Update occupancy based on time of day."""
+        sample = 0.5 * (self.noise[_NOISE_OCCUPANCY] + 1)  # uniform in [0, 1]
         if self.is_business_hours():
             # Occupied with some randomness
-            self.is_occupied = random.random() < 0.95
+            self.is_occupied = bool(sample < 0.95)
         else:
             # Mostly unoccupied after hours
-            self.is_occupied = random.random() < 0.05
+            self.is_occupied = bool(sample < 0.05)
+        self.occupancy_str = _ACTIVE if self.is_occupied else _INACTIVE
 
     def update_outdoor_temp(self):
         """Simulate outdoor temperature with daily cycle."""
-        hour = datetime.now().hour
         # Simple sinusoidal pattern: cooler at night, warmer during day
         base_temp = 75.0
         daily_swing = 15.0
-        self.outdoor_temp = base_temp + daily_swing * math.sin(
-            (hour - 6) * math.pi / 12
-        )
+        self.outdoor_temp = base_temp + daily_swing * _SIN_HOUR[self._hour]
         # Add some randomness
-        self.outdoor_temp += random.uniform(-2, 2)
-
-    def update_ahu(self):
-        """Update AHU state with realistic control logic."""
-        # Mixed air temperature (blend of return and outdoor)
-        outdoor_damper = 20.0 if self.is_occupied else 10.0  # % outdoor air
-        self.ahu_mixed_air_temp = (
-            self.ahu_return_air_temp * (100 - outdoor_damper) / 100
-            + self.outdoor_temp * outdoor_damper / 100
-        )
-
-        # Cooling valve control (PI controller)
-        temp_error = self.ahu_supply_air_temp - self.ahu_supply_air_setpoint
-        self.ahu_cooling_valve = max(
-            0, min(100, self.ahu_cooling_valve + temp_error * 2)
-        )
-
-        # Supply air temperature (affected by cooling valve)
-        cooling_effect = self.ahu_cooling_valve * 0.3  # Max 30°F cooling
-        self.ahu_supply_air_temp = self.ahu_mixed_air_temp - cooling_effect
-
-        # Return air is average of all zone temps
-        self.ahu_return_air_temp = sum(self.vav_zone_temps) / len(self.vav_zone_temps)
-
-        # Fan speed based on demand
-        if self.is_occupied:
-            self.ahu_fan_speed = 75.0 + random.uniform(-5, 5)
-        else:
-            self.ahu_fan_speed = 40.0 + random.uniform(-5, 5)
-
-        self.ahu_supply_air_flow = self.ahu_fan_speed * 160  # CFM
-
-    def update_vavs(self):
-        """Update all VAV zones with realistic control."""
-        for i in range(6):
-            # Zone load varies by occupancy
-            base_load = 0.5 if self.is_occupied else 0.1
-            zone_load = base_load + random.uniform(-0.2, 0.2)
-
-            # Perimeter zones (even indices) have more solar gain
-            if i % 2 == 0:
-                zone_load += 0.3
-
-            # Temperature control (PI controller)
-            temp_error = self.vav_zone_temps[i] - self.vav_zone_setpoints[i]
-
-            # Damper position control
-            self.vav_damper_positions[i] = max(
-                20, min(100, self.vav_damper_positions[i] + temp_error * 3)
-            )
-
-            # Airflow based on damper position
-            self.vav_airflows[i] = self.vav_damper_positions[i] * 30  # Max 3000 CFM
-
-            # Zone temperature physics
-            # Cooling from supply air
-            cooling_effect = (
-                (self.vav_airflows[i] / 2000.0)
-                * (self.vav_zone_temps[i] - self.ahu_supply_air_temp)
-                * 0.1
-            )
-            # Heat gain from zone load
-            heat_gain = zone_load * 2
-
-            self.vav_zone_temps[i] += (heat_gain - cooling_effect) * (INTERVAL / 60.0)
+        self.outdoor_temp += 2 * float(self.noise[_NOISE_OUTDOOR_TEMP])
+
+    def update_environment(self):
+        """Draw this tick's noise and update occupancy and outdoor conditions."""
+        # Clock calls stay in Python; the numeric core is compiled
+        self.update_clock()
+        # Refill the noise buffer in place with uniform samples in [-1, 1)
+        self.rng.random(out=self.noise)
+        self.noise *= 2.0
+        self.noise -= 1.0
+        self.update_occupancy()
+        self.update_outdoor_temp()
 
-            # Reheat valve (only if zone is too cold)
-            if self.vav_zone_temps[i] < self.vav_zone_setpoints[i] - 1:
-                self.vav_reheat_valves[i] = min(100, self.vav_reheat_valves[i] + 5)
-            else:
-                self.vav_reheat_valves[i] = max(0, self.vav_reheat_valves[i] - 5)
+    def update_hvac(self):
+        """Update the AHU and VAV zones, which feed each other."""
+        _update_hvac(self.buf, self.outdoor_temp, self.is_occupied, self.noise)
 
     def update_chiller(self):
-        """Update chiller state based on cooling load."""
-        # Cooling load from AHU
-        cooling_load = self.ahu_cooling_valve * 100  # kW (simplified)
-
-        # Chilled water temps respond to load
-        if cooling_load > 50:
-            self.chilled_water_supply_temp = 42.0 + random.uniform(-1, 1)
-            self.chilled_water_return_temp = 52.0 + random.uniform(-1, 1)
-        else:
-            self.chilled_water_supply_temp = 44.0 + random.uniform(-1, 1)
-            self.chilled_water_return_temp = 54.0 + random.uniform(-1, 1)
+        """Update the chiller from the AHU cooling load."""
+        _update_chiller(self.buf, self.noise)
 
     def update_power(self):
-        """Calculate total building power consumption."""
-        # AHU fan power
-        ahu_power = (self.ahu_fan_speed / 100) ** 3 * 15  # kW
-
-        # Chiller power (based on cooling valve position)
-        chiller_power = (self.ahu_cooling_valve / 100) * 80  # kW
-
-        # VAV reheat power
-        reheat_power = sum(self.vav_reheat_valves) / 100 * 2  # kW
-
-        # Lighting and plug loads
-        if self.is_occupied:
-            misc_power = 50 + random.uniform(-5, 5)
-        else:
-            misc_power = 10 + random.uniform(-2, 2)
-
-        self.total_power = ahu_power + chiller_power + reheat_power + misc_power
-        self.total_energy += self.total_power * (INTERVAL / 3600.0)  # kWh
+        """Update building power from the AHU and VAV state."""
+        _update_power(self.buf, self.is_occupied, self.noise)
 
     def update(self):
         """Update entire building simulation."""
-        self.update_occupancy()
-        self.update_outdoor_temp()
-        self.update_ahu()
-        self.update_vavs()
-        self.update_chiller()
-        self.update_power()
+        self.update_environment()
+        _tick(self.buf, self.outdoor_temp, self.is_occupied, self.noise)
 
 
 # --- Equipment Profiles ---
@@ -237,12 +444,13 @@ class AHUProfile:
     def __init__(self, building_state: BuildingState):
         """Initialize AHU profile."""
         self.state = building_state
+        self.objects: list[Any] = []
 
     def create_objects(self) -> list[Any]:
         """Create BACnet objects for the AHU."""
-        return [
+        self.objects = [
             # Supply Air Temperature
-            AnalogInputObject(
+            SimulatedAnalogInputObject(
                 objectIdentifier=("analogInput", 1),
                 objectName="AHU-1-Supply-Air-Temp",
                 presentValue=self.state.ahu_supply_air_temp,
@@ -250,7 +458,7 @@ class AHUProfile:
                 description="AHU Supply Air Temperature",
             ),
             # Return Air Temperature
-            AnalogInputObject(
+            SimulatedAnalogInputObject(
                 objectIdentifier=("analogInput", 2),
                 objectName="AHU-1-Return-Air-Temp",
                 presentValue=self.state.ahu_return_air_temp,
@@ -258,7 +466,7 @@ class AHUProfile:
                 description="AHU Return Air Temperature",
             ),
             # Mixed Air Temperature
-            AnalogInputObject(
+            SimulatedAnalogInputObject(
                 objectIdentifier=("analogInput", 3),
                 objectName="AHU-1-Mixed-Air-Temp",
                 presentValue=self.state.ahu_mixed_air_temp,
@@ -266,7 +474,7 @@ class AHUProfile:
                 description="AHU Mixed Air Temperature",
             ),
             # Supply Air Flow
-            AnalogInputObject(
+            SimulatedAnalogInputObject(
                 objectIdentifier=("analogInput", 4),
                 objectName="AHU-1-Supply-Air-Flow",
                 presentValue=self.state.ahu_supply_air_flow,
@@ -301,51 +509,77 @@ class AHUProfile:
             BinaryInputObject(
                 objectIdentifier=("binaryInput", 1),
                 objectName="AHU-1-Fan-Status",
-                presentValue="active",
+                presentValue=_ACTIVE,
                 description="AHU Fan Running Status",
             ),
             # Enable/Disable
             BinaryOutputObject(
                 objectIdentifier=("binaryOutput", 1),
                 objectName="AHU-1-Enable",
-                presentValue="active",
+                presentValue=_ACTIVE,
                 description="AHU Enable Command",
             ),
         ]
 
-    def update_objects(self, objects: list[Any]):
-        """Update object values from building state."""
-        objects[0].presentValue = self.state.ahu_supply_air_temp
-        objects[1].presentValue = self.state.ahu_return_air_temp
-        objects[2].presentValue = self.state.ahu_mixed_air_temp
-        objects[3].presentValue = self.state.ahu_supply_air_flow
+        # Bind objects by role so updates avoid list indexing
+        (
+            self._obj_supply_air_temp,
+            self._obj_return_air_temp,
+            self._obj_mixed_air_temp,
+            self._obj_supply_air_flow,
+            self._obj_supply_air_setpoint,
+            self._obj_fan_speed,
+            self._obj_cooling_valve,
+            self._obj_fan_status,
+            self._obj_enable,
+        ) = self.objects
+        return self.objects
+
+    def bindings(self) -> list[tuple[Any, int]]:
+        """Return (object, state buffer index) pairs copied every tick."""
+        return [
+            (self._obj_supply_air_temp, _IDX_AHU_SUPPLY_AIR_TEMP),
+            (self._obj_return_air_temp, _IDX_AHU_RETURN_AIR_TEMP),
+            (self._obj_mixed_air_temp, _IDX_AHU_MIXED_AIR_TEMP),
+            (self._obj_supply_air_flow, _IDX_AHU_SUPPLY_AIR_FLOW),
+            (self._obj_fan_speed, _IDX_AHU_FAN_SPEED),
+            (self._obj_cooling_valve, _IDX_AHU_COOLING_VALVE),
+        ]
+
+    def update_objects(self):
+        """Update the object values not covered by bindings()."""
         # Setpoint is commandable, read from object
-        self.state.ahu_supply_air_setpoint = objects[4].presentValue
-        objects[5].presentValue = self.state.ahu_fan_speed
-        objects[6].presentValue = self.state.ahu_cooling_valve
+        self.state.ahu_supply_air_setpoint = self._obj_supply_air_setpoint.presentValue
 
 
 class VAVProfile:
     """Variable Air Volume Box."""
 
     def __init__(
-        self, building_state: BuildingState, zone_index: int, floor: int, zone_name: str
+        self,
+        building_state: BuildingState,
+        zone_index: int,
+        floor: int,
+        zone_name: str,
+        instance_offset: int = 0,
     ):
         """Initialize VAV profile."""
         self.state = building_state
         self.zone_index = zone_index
         self.floor = floor
         self.zone_name = zone_name
+        self.instance_offset = instance_offset
+        self.objects: list[Any] = []
 
     def create_objects(self) -> list[Any]:
         """Create BACnet objects for the VAV."""
-        base_id = self.zone_index * 10
-        return [
+        base_id = self.instance_offset + self.zone_index * 10
+        self.objects = [
             # Zone Temperature
-            AnalogInputObject(
+            SimulatedAnalogInputObject(
                 objectIdentifier=("analogInput", base_id + 1),
                 objectName=f"Floor{self.floor}-{self.zone_name}-Zone-Temp",
-                presentValue=self.state.vav_zone_temps[self.zone_index],
+                presentValue=self.state.vav_zone_temps[self.zone_index].item(),
                 units=EngineeringUnits.degreesFahrenheit,
                 description=f"Floor {self.floor} {self.zone_name} Zone Temperature",
             ),
@@ -353,7 +587,7 @@ class VAVProfile:
             CommandableAnalogValueObject(
                 objectIdentifier=("analogValue", base_id + 1),
                 objectName=f"Floor{self.floor}-{self.zone_name}-Zone-Temp-SP",
-                presentValue=self.state.vav_zone_setpoints[self.zone_index],
+                presentValue=self.state.vav_zone_setpoints[self.zone_index].item(),
                 units=EngineeringUnits.degreesFahrenheit,
                 description=f"Floor {self.floor} {self.zone_name} Zone Temperature Setpoint",
             ),
@@ -361,15 +595,15 @@ class VAVProfile:
             AnalogOutputObject(
                 objectIdentifier=("analogOutput", base_id + 1),
                 objectName=f"Floor{self.floor}-{self.zone_name}-Damper-Pos",
-                presentValue=self.state.vav_damper_positions[self.zone_index],
+                presentValue=self.state.vav_damper_positions[self.zone_index].item(),
                 units=EngineeringUnits.percent,
                 description=f"Floor {self.floor} {self.zone_name} Damper Position",
             ),
             # Airflow
-            AnalogInputObject(
+            SimulatedAnalogInputObject(
                 objectIdentifier=("analogInput", base_id + 2),
                 objectName=f"Floor{self.floor}-{self.zone_name}-Airflow",
-                presentValue=self.state.vav_airflows[self.zone_index],
+                presentValue=self.state.vav_airflows[self.zone_index].item(),
                 units=EngineeringUnits.cubicFeetPerMinute,
                 description=f"Floor {self.floor} {self.zone_name} Airflow",
             ),
@@ -377,28 +611,46 @@ class VAVProfile:
             AnalogOutputObject(
                 objectIdentifier=("analogOutput", base_id + 2),
                 objectName=f"Floor{self.floor}-{self.zone_name}-Reheat-Valve",
-                presentValue=self.state.vav_reheat_valves[self.zone_index],
+                presentValue=self.state.vav_reheat_valves[self.zone_index].item(),
                 units=EngineeringUnits.percent,
                 description=f"Floor {self.floor} {self.zone_name} Reheat Valve",
             ),
             # Occupancy
-            BinaryInputObject(
+            SimulatedBinaryInputObject(
                 objectIdentifier=("binaryInput", base_id + 1),
                 objectName=f"Floor{self.floor}-{self.zone_name}-Occupancy",
-                presentValue="active" if self.state.is_occupied else "inactive",
+                presentValue=self.state.occupancy_str,
                 description=f"Floor {self.floor} {self.zone_name} Occupancy Sensor",
             ),
         ]
 
-    def update_objects(self, objects: list[Any]):
-        """Update object values from building state."""
-        objects[0].presentValue = self.state.vav_zone_temps[self.zone_index]
+        # Bind objects by role so updates avoid list indexing
+        (
+            self._obj_zone_temp,
+            self._obj_zone_setpoint,
+            self._obj_damper_position,
+            self._obj_airflow,
+            self._obj_reheat_valve,
+            self._obj_occupancy,
+        ) = self.objects
+        return self.objects
+
+    def bindings(self) -> list[tuple[Any, int]]:
+        """Return (object, state buffer index) pairs copied every tick."""
+        i = self.zone_index
+        return [
+            (self._obj_zone_temp, _IDX_VAV_ZONE_TEMPS + i),
+            (self._obj_damper_position, _IDX_VAV_DAMPER_POSITIONS + i),
+            (self._obj_airflow, _IDX_VAV_AIRFLOWS + i),
+            (self._obj_reheat_valve, _IDX_VAV_REHEAT_VALVES + i),
+        ]
+
+    def update_objects(self):
+        """Update the object values not covered by bindings()."""
+        s, i = self.state, self.zone_index
         # Setpoint is commandable
-        self.state.vav_zone_setpoints[self.zone_index] = objects[1].presentValue
-        objects[2].presentValue = self.state.vav_damper_positions[self.zone_index]
-        objects[3].presentValue = self.state.vav_airflows[self.zone_index]
-        objects[4].presentValue = self.state.vav_reheat_valves[self.zone_index]
-        objects[5].presentValue = "active" if self.state.is_occupied else "inactive"
+        s.vav_zone_setpoints[i] = self._obj_zone_setpoint.presentValue
+        self._obj_occupancy.set_present_value(s.occupancy_str)
 
 
 class ChillerProfile:
@@ -407,12 +659,13 @@ class ChillerProfile:
     def __init__(self, building_state: BuildingState):
         """Initialize Chiller profile."""
         self.state = building_state
+        self.objects: list[Any] = []
 
     def create_objects(self) -> list[Any]:
         """Create BACnet objects for the Chiller."""
-        return [
+        self.objects = [
             # Chilled Water Supply Temperature
-            AnalogInputObject(
+            SimulatedAnalogInputObject(
                 objectIdentifier=("analogInput", 100),
                 objectName="Chiller-1-CHW-Supply-Temp",
                 presentValue=self.state.chilled_water_supply_temp,
@@ -420,7 +673,7 @@ class ChillerProfile:
                 description="Chiller Chilled Water Supply Temperature",
             ),
             # Chilled Water Return Temperature
-            AnalogInputObject(
+            SimulatedAnalogInputObject(
                 objectIdentifier=("analogInput", 101),
                 objectName="Chiller-1-CHW-Return-Temp",
                 presentValue=self.state.chilled_water_return_temp,
@@ -431,22 +684,37 @@ class ChillerProfile:
             BinaryInputObject(
                 objectIdentifier=("binaryInput", 100),
                 objectName="Chiller-1-Status",
-                presentValue="active",
+                presentValue=_ACTIVE,
                 description="Chiller Running Status",
             ),
             # Chiller Enable
             BinaryOutputObject(
                 objectIdentifier=("binaryOutput", 100),
                 objectName="Chiller-1-Enable",
-                presentValue="active",
+                presentValue=_ACTIVE,
                 description="Chiller Enable Command",
             ),
         ]
 
-    def update_objects(self, objects: list[Any]):
-        """Update object values from building state."""
-        objects[0].presentValue = self.state.chilled_water_supply_temp
-        objects[1].presentValue = self.state.chilled_water_return_temp
+        # Bind objects by role so updates avoid list indexing
+        (
+            self._obj_chw_supply_temp,
+            self._obj_chw_return_temp,
+            self._obj_status,
+            self._obj_enable,
+        ) = self.objects
+        return self.objects
+
+    def bindings(self) -> list[tuple[Any, int]]:
+        """Return (object, state buffer index) pairs copied every tick."""
+        return [
+            (self._obj_chw_supply_temp, _IDX_CHW_SUPPLY_TEMP),
+            (self._obj_chw_return_temp, _IDX_CHW_RETURN_TEMP),
+        ]
+
+    def update_objects(self):
+        """Update the object values not covered by bindings()."""
+        # Every chiller value is covered by bindings()
 
 
 class MeterProfile:
@@ -455,12 +723,13 @@ class MeterProfile:
     def __init__(self, building_state: BuildingState):
         """Initialize Meter profile."""
         self.state = building_state
+        self.objects: list[Any] = []
 
     def create_objects(self) -> list[Any]:
         """Create BACnet objects for the Meter."""
-        return [
+        self.objects = [
             # Total Power
-            AnalogInputObject(
+            SimulatedAnalogInputObject(
                 objectIdentifier=("analogInput", 200),
                 objectName="Main-Meter-Total-Power",
                 presentValue=self.state.total_power,
@@ -468,7 +737,7 @@ class MeterProfile:
                 description="Building Total Power Demand",
             ),
             # Total Energy
-            AnalogInputObject(
+            SimulatedAnalogInputObject(
                 objectIdentifier=("analogInput", 201),
                 objectName="Main-Meter-Total-Energy",
                 presentValue=self.state.total_energy,
@@ -476,7 +745,7 @@ class MeterProfile:
                 description="Building Total Energy Consumption",
             ),
             # Voltage
-            AnalogInputObject(
+            SimulatedAnalogInputObject(
                 objectIdentifier=("analogInput", 202),
                 objectName="Main-Meter-Voltage",
                 presentValue=480.0,
@@ -485,15 +754,36 @@ class MeterProfile:
             ),
         ]
 
-    def update_objects(self, objects: list[Any]):
-        """Update object values from building state."""
-        objects[0].presentValue = self.state.total_power
-        objects[1].presentValue = self.state.total_energy
-        objects[2].presentValue = 480.0 + random.uniform(-5, 5)
+        # Bind objects by role so updates avoid list indexing
+        (
+            self._obj_total_power,
+            self._obj_total_energy,
+            self._obj_voltage,
+        ) = self.objects
+        return self.objects
+
+    def bindings(self) -> list[tuple[Any, int]]:
+        """Return (object, state buffer index) pairs copied every tick."""
+        return [
+            (self._obj_total_power, _IDX_TOTAL_POWER),
+            (self._obj_total_energy, _IDX_TOTAL_ENERGY),
+        ]
+
+    def update_objects(self):
+        """Update the object values not covered by bindings()."""
+        self._obj_voltage.set_present_value(
+            480.0 + 5 * float(self.state.noise[_NOISE_METER_VOLTAGE])
+        )
 
 
 # --- Main Application ---
 
+# Every equipment simulated by ``--equipment all``
+EQUIPMENT_TYPES = ["ahu", *(f"vav{i}" for i in range(6)), "chiller", "meter"]
+
+# VAV object instances collide with the AHU's when sharing one device
+_SHARED_VAV_INSTANCE_OFFSET = 10
+
 
 class BuildingSimulator:
     """Complete building simulation."""
@@ -503,74 +793,185 @@ class BuildingSimulator:
         self.app = Application.from_args(args)
         self.state = BuildingState()
         self.equipment_type = equipment_type
-        self.profile: AHUProfile | VAVProfile | ChillerProfile | MeterProfile
+        self.profiles: list[AHUProfile | VAVProfile | ChillerProfile | MeterProfile]
         self.objects: list[Any] = []
 
-        # Create equipment based on type
+        # Create equipment based on type; "all" shares this state and device
+        if equipment_type == "all":
+            self.profiles = [
+                self._make_profile(eq, _SHARED_VAV_INSTANCE_OFFSET)
+                for eq in EQUIPMENT_TYPES
+            ]
+        else:
+            self.profiles = [self._make_profile(equipment_type)]
+
+        for profile in self.profiles:
+            self.objects.extend(profile.create_objects())
+        self.cov_objects = [obj for obj in self.objects if isinstance(obj, DeferredCOV)]
+
+        # Flat (setter, state buffer index) table for the values that mirror
+        # a buffer slot, so the per-tick copy is one same-shape loop
+        self.updates: list[tuple[Callable[[Any], None], int]] = []
+        for profile in self.profiles:
+            for obj, idx in profile.bindings():
+                if isinstance(obj, DeferredCOV):
+                    set_value = obj.set_present_value
+                else:
+                    # Commandable outputs write through the priority array
+                    set_value = partial(setattr, obj, "presentValue")
+                self.updates.append((set_value, idx))
+        self.tick = self._make_tick(equipment_type)
+        self.log_status = self._make_logger(equipment_type)
+
+        for obj in self.objects:
+            self.app.add_object(obj)
+
+        logger.info(f"Initialized {equipment_type} with {len(self.objects)} objects")
+        self.update_task = asyncio.create_task(self.update_loop())
+
+    def _make_profile(
+        self, equipment_type: str, vav_instance_offset: int = 0
+    ) -> AHUProfile | VAVProfile | ChillerProfile | MeterProfile:
+        """Create the equipment profile for ``equipment_type``."""
         if equipment_type == "ahu":
-            self.profile = AHUProfile(self.state)
+            return AHUProfile(self.state)
         elif equipment_type.startswith("vav"):
             # Parse VAV index from equipment_type (e.g., "vav0", "vav1", ...)
             zone_index = int(equipment_type[3:])
             floor = (zone_index // 2) + 1
             zone_name = "North" if zone_index % 2 == 0 else "South"
-            self.profile = VAVProfile(self.state, zone_index, floor, zone_name)
+            return VAVProfile(
+                self.state, zone_index, floor, zone_name, vav_instance_offset
+            )
         elif equipment_type == "chiller":
-            self.profile = ChillerProfile(self.state)
+            return ChillerProfile(self.state)
         elif equipment_type == "meter":
-            self.profile = MeterProfile(self.state)
+            return MeterProfile(self.state)
         else:
             raise ValueError(f"Unknown equipment type: {equipment_type}")
 
-        self.objects = self.profile.create_objects()
+    def _make_tick(self, equipment_type: str) -> Callable[[], None]:
+        """Return the subset of the building update this equipment needs.
 
-        for obj in self.objects:
-            self.app.add_object(obj)
+        The AHU and VAVs are coupled: VAV cooling depends on the AHU supply
+        air temperature and the AHU return air is the average zone temperature,
+        so every role updates both. The chiller follows the AHU cooling valve
+        and the meter sums fan, chiller and reheat power; neither of those
+        feeds back into the HVAC loop, so each is only run where it is served.
+        """
+        state = self.state
 
-        logger.info(f"Initialized {equipment_type} with {len(self.objects)} objects")
-        asyncio.create_task(self.update_loop())
+        if equipment_type == "all":
+            return state.update
+
+        elif equipment_type == "chiller":
+
+            def tick():
+                state.update_environment()
+                state.update_hvac()
+                state.update_chiller()
+
+        elif equipment_type == "meter":
+
+            def tick():
+                state.update_environment()
+                state.update_hvac()
+                state.update_power()
+
+        else:
+
+            def tick():
+                state.update_environment()
+                state.update_hvac()
+
+        return tick
+
+    def _make_logger(self, equipment_type: str) -> Callable[[], None]:
+        """Return the status logger for this equipment."""
+        state = self.state
+
+        if equipment_type == "all":
+            loggers = [self._make_logger(eq) for eq in EQUIPMENT_TYPES]
+
+            def log_status():
+                for log in loggers:
+                    log()
+
+        elif equipment_type == "ahu":
+
+            def log_status():
+                logger.info(
+                    "AHU: Supply=%.1f°F, Return=%.1f°F, Fan=%.0f%%, Cooling=%.0f%%",
+                    state.ahu_supply_air_temp,
+                    state.ahu_return_air_temp,
+                    state.ahu_fan_speed,
+                    state.ahu_cooling_valve,
+                )
+
+        elif equipment_type.startswith("vav"):
+            idx = int(equipment_type[3:])
+
+            def log_status():
+                logger.info(
+                    "VAV%d: Zone=%.1f°F, SP=%.1f°F, Damper=%.0f%%, Flow=%.0fCFM",
+                    idx,
+                    state.vav_zone_temps[idx],
+                    state.vav_zone_setpoints[idx],
+                    state.vav_damper_positions[idx],
+                    state.vav_airflows[idx],
+                )
+
+        elif equipment_type == "chiller":
+
+            def log_status():
+                logger.info(
+                    "Chiller: Supply=%.1f°F, Return=%.1f°F",
+                    state.chilled_water_supply_temp,
+                    state.chilled_water_return_temp,
+                )
+
+        else:
+
+            def log_status():
+                logger.info(
+                    "Meter: Power=%.1fkW, Energy=%.1fkWh",
+                    state.total_power,
+                    state.total_energy,
+                )
+
+        return log_status
 
     async def update_loop(self):
         """Main simulation loop."""
+        # Schedule ticks against fixed deadlines so the work done in each
+        # tick does not stretch the interval
+        loop = asyncio.get_running_loop()
+        next_time = loop.time()
         while True:
-            try:
-                # Update building physics
-                self.state.update()
-
-                # Update BACnet objects
-                self.profile.update_objects(self.objects)
-
-                # Log status on every iteration
-                if self.equipment_type == "ahu":
-                    logger.info(
-                        f"AHU: Supply={self.state.ahu_supply_air_temp:.1f}°F, "
-                        f"Return={self.state.ahu_return_air_temp:.1f}°F, "
-                        f"Fan={self.state.ahu_fan_speed:.0f}%, "
-                        f"Cooling={self.state.ahu_cooling_valve:.0f}%"
-                    )
-                elif self.equipment_type.startswith("vav"):
-                    idx = int(self.equipment_type[3:])
-                    logger.info(
-                        f"VAV{idx}: Zone={self.state.vav_zone_temps[idx]:.1f}°F, "
-                        f"SP={self.state.vav_zone_setpoints[idx]:.1f}°F, "
-                        f"Damper={self.state.vav_damper_positions[idx]:.0f}%, "
-                        f"Flow={self.state.vav_airflows[idx]:.0f}CFM"
-                    )
-                elif self.equipment_type == "chiller":
-                    logger.info(
-                        f"Chiller: Supply={self.state.chilled_water_supply_temp:.1f}°F, "
-                        f"Return={self.state.chilled_water_return_temp:.1f}°F"
-                    )
-                elif self.equipment_type == "meter":
-                    logger.info(
-                        f"Meter: Power={self.state.total_power:.1f}kW, "
-                        f"Energy={self.state.total_energy:.1f}kWh"
-                    )
-
-            except Exception as e:
-                logger.error(f"Error in update loop: {e}")
-
-            await asyncio.sleep(INTERVAL)
+            # Update building physics
+            self.tick()
+
+            # Update BACnet objects
+            values = self.state.buf.tolist()
+            for set_value, idx in self.updates:
+                set_value(values[idx])
+            for profile in self.profiles:
+                profile.update_objects()
+            for obj in self.cov_objects:
+                obj.flush_cov()
+
+            # Log status on every iteration
+            if logger.isEnabledFor(logging.INFO):
+                self.log_status()
+
+            next_time += INTERVAL
+            delay = next_time - loop.time()
+            if delay < 0:
+                # Overrun: skip the missed ticks rather than running them back
+                # to back
+                next_time = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
 
 
 async def main():
@@ -580,12 +981,14 @@ async def main():
         "--equipment",
         type=str,
         required=True,
-        help="Equipment type: ahu, vav0-5, chiller, meter",
+        help="Equipment type: all, ahu, vav0-5, chiller, meter",
     )
     args = parser.parse_args()
 
-    BuildingSimulator(args, args.equipment)
-    await asyncio.Future()
+    simulator = BuildingSimulator(args, args.equipment)
+
+    # The update loop runs forever; an error in it ends the process
+    await simulator.update_task
 
 
 def run():